@@ -1,5 +1,6 @@
 from pathlib import Path
 from re import findall
+from uuid import uuid4
 
 from modules.BaseCardType import BaseCardType
 from modules.Debug import log
@@ -44,14 +45,14 @@ class WhiteTextAbsolute(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Sequel-Neue.otf'
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __SOURCE_WITH_GRADIENT = BaseCardType.TEMP_DIR / 'source_gradient.png'
-    __GRADIENT_WITH_TITLE = BaseCardType.TEMP_DIR / 'gradient_title.png'
+    """Series count font paths, resolved once for all commands"""
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT.resolve())
 
     __slots__ = (
         'source_file', 'output_file', 'title', 'episode_text', 'font',
         'font_size', 'title_color', 'vertical_shift', 'interline_spacing',
-        'kerning', 'stroke_width'
+        'kerning', 'stroke_width', '__source_with_gradient',
+        '__gradient_with_title',
     )
 
 
@@ -77,6 +78,15 @@ class WhiteTextAbsolute(BaseCardType):
         # Initialize the parent class - this sets up an ImageMagickInterface
         super().__init__(blur, grayscale)
 
+        # Paths to intermediate files that are deleted after the card is created
+        temp_prefix = uuid4().hex
+        self.__source_with_gradient = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_source_gradient.miff'
+        )
+        self.__gradient_with_title = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_gradient_title.miff'
+        )
+
         self.source_file = source_file
         self.output_file = card_file
 
@@ -194,12 +204,12 @@ class WhiteTextAbsolute(BaseCardType):
             f'"{self.__GRADIENT_IMAGE.resolve()}"',
             f'-background None',
             f'-layers Flatten',
-            f'"{self.__SOURCE_WITH_GRADIENT.resolve()}"',
+            f'"{self.__source_with_gradient.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__SOURCE_WITH_GRADIENT
+        return self.__source_with_gradient
 
 
     def _add_title_text(self, gradient_image: Path) -> Path:
@@ -221,12 +231,12 @@ class WhiteTextAbsolute(BaseCardType):
             f'-annotate +0+{vertical_shift} "{self.title}"',
             f'-fill "{self.title_color}"',
             f'-annotate +0+{vertical_shift} "{self.title}"',
-            f'"{self.__GRADIENT_WITH_TITLE.resolve()}"',
+            f'"{self.__gradient_with_title.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__GRADIENT_WITH_TITLE
+        return self.__gradient_with_title
 
 
     def _add_series_count_text_no_season(self, titled_image: Path) -> Path:
@@ -241,7 +251,7 @@ class WhiteTextAbsolute(BaseCardType):
         command = ' '.join([
             f'convert "{titled_image.resolve()}"',
             *self.__series_count_text_global_effects(),
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity west',
             *self.__series_count_text_black_stroke(),
             f'-annotate +100-750 "{self.episode_text}"',
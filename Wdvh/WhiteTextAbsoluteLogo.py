@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Optional
+from uuid import uuid4
 
 from modules.BaseCardType import BaseCardType
 from modules.Debug import log
@@ -44,15 +45,14 @@ class WhiteTextAbsoluteLogo(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Sequel-Neue.otf'
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __RESIZED_LOGO = BaseCardType.TEMP_DIR / 'resized_logo.png'
-    __BACKDROP_WITH_LOGO = BaseCardType.TEMP_DIR / 'backdrop_logo.png'
-    __LOGO_WITH_TITLE = BaseCardType.TEMP_DIR / 'logo_title.png'
+    """Series count font paths, resolved once for all commands"""
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT.resolve())
 
     __slots__ = (
         'logo', 'output_file', 'title', 'episode_text', 'font', 'font_size',
         'title_color', 'vertical_shift', 'interline_spacing', 'kerning',
-        'stroke_width', 'background'
+        'stroke_width', 'background', '__resized_logo',
+        '__backdrop_with_logo', '__logo_with_title',
     )
 
 
@@ -79,6 +79,18 @@ class WhiteTextAbsoluteLogo(BaseCardType):
         # Initialize the parent class - this sets up an ImageMagickInterface
         super().__init__(blur, grayscale)
 
+        # Paths to intermediate files that are deleted after the card is created
+        temp_prefix = uuid4().hex
+        self.__resized_logo = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_resized_logo.miff'
+        )
+        self.__backdrop_with_logo = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_backdrop_logo.miff'
+        )
+        self.__logo_with_title = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_logo_title.miff'
+        )
+
         # Look for logo if it's a format string
         if isinstance(logo, str):
             self.logo = Path(logo)
@@ -202,12 +214,12 @@ class WhiteTextAbsoluteLogo(BaseCardType):
             f'"{self.logo.resolve()}"',
             f'-resize x1030',
             f'-resize 1875x1030\>',
-            f'"{self.__RESIZED_LOGO.resolve()}"',
+            f'"{self.__resized_logo.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__RESIZED_LOGO
+        return self.__resized_logo
 
 
     def _add_logo_to_backdrop(self, resized_logo: Path) -> Path:
@@ -238,12 +250,12 @@ class WhiteTextAbsoluteLogo(BaseCardType):
             f'-set colorspace sRGB',
             f'-gravity north',
             f'-geometry "+0+{offset}"',         # Put logo on backdrop
-            f'-composite "{self.__BACKDROP_WITH_LOGO.resolve()}"',
+            f'-composite "{self.__backdrop_with_logo.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__BACKDROP_WITH_LOGO
+        return self.__backdrop_with_logo
 
 
     def _add_title_text(self, backdrop_logo: Path) -> Path:
@@ -265,12 +277,12 @@ class WhiteTextAbsoluteLogo(BaseCardType):
             f'-annotate +0+{vertical_shift} "{self.title}"',
             f'-fill "{self.title_color}"',
             f'-annotate +0+{vertical_shift} "{self.title}"',
-            f'"{self.__LOGO_WITH_TITLE.resolve()}"',
+            f'"{self.__logo_with_title.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__LOGO_WITH_TITLE
+        return self.__logo_with_title
 
 
     def _add_series_count_text_no_season(self, titled_image: Path) -> Path:
@@ -285,7 +297,7 @@ class WhiteTextAbsoluteLogo(BaseCardType):
         command = ' '.join([
             f'convert "{titled_image.resolve()}"',
             *self.__series_count_text_global_effects(),
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity west',
             *self.__series_count_text_black_stroke(),
             f'-annotate +100-750 "{self.episode_text}"',
@@ -368,4 +380,6 @@ class WhiteTextAbsoluteLogo(BaseCardType):
         self._add_series_count_text_no_season(titled_image)
 
         # Delete all intermediate images
-        self.image_magick.delete_intermediate_images(backdrop_logo, titled_image)
\ No newline at end of file
+        self.image_magick.delete_intermediate_images(
+            resized_logo, backdrop_logo, titled_image
+        )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pathlib import Path
-from re import findall
+from re import compile as re_compile
 from typing import Optional
 
 from modules.BaseCardType import BaseCardType
@@ -42,11 +42,18 @@ class WhiteTextStandardLogo(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Sequel-Neue.otf'
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __RESIZED_LOGO = BaseCardType.TEMP_DIR / 'resized_logo.png'
-    __BACKDROP_WITH_LOGO = BaseCardType.TEMP_DIR / 'backdrop_logo.png'
-    __LOGO_WITH_TITLE = BaseCardType.TEMP_DIR / 'logo_title.png'
-    __SERIES_COUNT_TEXT = BaseCardType.TEMP_DIR / 'series_count_text.png'
+    """Series count font paths, resolved once for all commands"""
+    __SEASON_COUNT_FONT = str(SEASON_COUNT_FONT.resolve())
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT.resolve())
+
+    """Regex to match text dimensions in ImageMagick annotate debug output"""
+    __METRICS_REGEX = re_compile(
+        r'Metrics:.*width:\s+(\d+)[^;]*;\s+height:\s+(\d+)'
+    )
+
+    """Series count text dimensions already measured, keyed by the text"""
+    __DIMENSIONS_CACHE: dict[tuple[str, str, str], dict] = {}
+    __DIMENSIONS_CACHE_SIZE = 256
 
     __slots__ = (
         'logo', 'output_file', 'title', 'season_text', 'episode_text', 'font',
@@ -204,115 +211,71 @@ class WhiteTextStandardLogo(BaseCardType):
         ]
 
 
-    def _resize_logo(self) -> Path:
-        """
-        Resize the logo into at most a 1875x1030 bounding box.
-        
-        Returns:
-            Path to the created image.
-        """
-
-        command = ' '.join([
-            f'convert',
-            f'"{self.logo.resolve()}"',
-            f'-resize x1030',
-            f'-resize 1875x1030\>',
-            f'"{self.__RESIZED_LOGO.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.__RESIZED_LOGO
-
-
-    def _add_logo_to_backdrop(self, resized_logo: Path) -> Path:
+    def __logo_commands(self) -> list[str]:
         """
-        Add the resized logo to a fixed color backdrop.
+        ImageMagick commands to create the fixed color backdrop and add the
+        logo (resized into at most a 1875x1030 bounding box) to it.
         
         Returns:
-            Path to the created image.
+            List of ImageMagick commands.
         """
 
-        # Get height of the resized logo to determine offset
-        height_command = ' '.join([
-            f'identify',
-            f'-format "%h"',
-            f'"{resized_logo.resolve()}"',
-        ])
-
-        height = int(self.image_magick.run_get_output(height_command))
-
-        # Get offset of where to place logo onto card
-        offset = 60 + ((1030 - height) // 2)
+        # Center logo within the 1030px tall box 60px from the top
+        offset = 60 + (1030 // 2) - (self.HEIGHT // 2)
 
-        command = ' '.join([
-            f'convert',
+        return [
             f'-size "{self.TITLE_CARD_SIZE}"',  # Create backdrop
             f'xc:"{self.background}"',          # Fill canvas with color
-            f'"{resized_logo.resolve()}"',
+            f'\( "{self.logo.resolve()}"',
+            f'-resize x1030',
+            f'-resize 1875x1030\> \)',
             f'-set colorspace sRGB',
-            f'-gravity north',
-            f'-geometry "+0+{offset}"',         # Put logo on backdrop
-            f'-composite "{self.__BACKDROP_WITH_LOGO.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.__BACKDROP_WITH_LOGO
+            f'-gravity center',
+            f'-geometry "+0{offset:+}"',        # Put logo on backdrop
+            f'-composite',
+        ]
 
 
-    def _add_title_text(self, backdrop_logo: Path) -> Path:
+    def __title_text_commands(self) -> list[str]:
         """
-        Adds episode title text to the provide image.
-
-        :param      backdrop_logo:  The backdrop and logo image.
+        ImageMagick commands to add the episode title text.
         
-        :returns:   Path to the created image that has the title text added.
+        Returns:
+            List of ImageMagick commands.
         """
 
         vertical_shift = 245 + self.vertical_shift
 
-        command = ' '.join([
-            f'convert "{backdrop_logo.resolve()}"',
-            *self.resize_and_style,
+        return [
             *self.__title_text_global_effects(),
             *self.__title_text_black_stroke(),
             f'-annotate +0+{vertical_shift} "{self.title}"',
             f'-fill "{self.title_color}"',
             f'-annotate +0+{vertical_shift} "{self.title}"',
-            f'"{self.__LOGO_WITH_TITLE.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.__LOGO_WITH_TITLE
+            # Reset title text spacing for the series count text
+            f'+interword-spacing',
+            f'+interline-spacing',
+        ]
 
 
-    def _add_series_count_text_no_season(self, titled_image: Path) -> Path:
+    def __series_count_text_no_season_commands(self) -> list[str]:
         """
-        Adds the series count text without season title/number.
+        ImageMagick commands to add the series count text without season
+        title/number.
         
-        :param      titled_image:  The titled image to add text to.
-
-        :returns:   Path to the created image (the output file).
+        Returns:
+            List of ImageMagick commands.
         """
 
-        command = ' '.join([
-            f'convert "{titled_image.resolve()}"',
+        return [
             *self.__series_count_text_global_effects(),
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity center',
             *self.__series_count_text_black_stroke(),
             f'-annotate +0+697.2 "{self.episode_text}"',
             *self.__series_count_text_effects(),
             f'-annotate +0+697.2 "{self.episode_text}"',
-            *self.resize_output,
-            f'"{self.output_file.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.output_file
+        ]
 
 
     def _get_series_count_text_dimensions(self) -> dict:
@@ -322,14 +285,19 @@ class WhiteTextStandardLogo(BaseCardType):
         :returns:   The series count text dimensions.
         """
 
+        # Reuse the dimensions if this text has already been measured
+        cache_key = (self.season_text, self.separator, self.episode_text)
+        if (dimensions := self.__DIMENSIONS_CACHE.get(cache_key)) is not None:
+            return dimensions
+
         command = ' '.join([
             f'convert -debug annotate xc: ',
             *self.__series_count_text_global_effects(),
-            f'-font "{self.SEASON_COUNT_FONT.resolve()}"',
+            f'-font "{self.__SEASON_COUNT_FONT}"',
             f'-gravity east',
             *self.__series_count_text_effects(),
             f'-annotate +1600+697.2 "{self.season_text} "',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity center',
             *self.__series_count_text_effects(),
             f'-annotate +0+689.5 "{self.separator} "',
@@ -341,45 +309,61 @@ class WhiteTextStandardLogo(BaseCardType):
 
         # Get text dimensions from the output
         metrics = self.image_magick.run_get_output(command)
-        widths = list(map(int, findall(r'Metrics:.*width:\s+(\d+)', metrics)))
-        heights = list(map(int, findall(r'Metrics:.*height:\s+(\d+)', metrics)))
+        widths, heights = [], []
+        for width, height in self.__METRICS_REGEX.findall(metrics):
+            widths.append(int(width))
+            heights.append(int(height))
 
         # Don't raise IndexError if no dimensions were found
-        if len(widths) < 2 or len(heights) < 2:
+        measured = len(widths) >= 2 and len(heights) >= 2
+        if not measured:
             log.warning(f'Unable to identify font dimensions, file bug report')
             widths = [370, 47, 357]
             heights = [68, 83, 83]
 
-        return {
+        dimensions = {
             'width':    sum(widths),
             'width1':   widths[0],
             'width2':   widths[1],
             'height':   max(heights)+25,
         }
 
+        # Only reuse dimensions that were actually measured, evicting the
+        # oldest measurement once the cache is full
+        if measured:
+            if len(self.__DIMENSIONS_CACHE) >= self.__DIMENSIONS_CACHE_SIZE:
+                del self.__DIMENSIONS_CACHE[next(iter(self.__DIMENSIONS_CACHE))]
+            self.__DIMENSIONS_CACHE[cache_key] = dimensions
+
+        return dimensions
+
 
-    def _create_series_count_text_image(self,
-            width: float, width1: float, width2: float, height: float) -> Path:
+    def __series_count_text_commands(self,
+            width: float, width1: float, width2: float, height: float
+        ) -> list[str]:
         """
-        Creates an image with only series count text. This image is transparent,
-        and not any wider than is necessary (as indicated by `dimensions`).
+        ImageMagick commands to create a transparent image with only series
+        count text - not any wider than is necessary (as indicated by the given
+        dimensions) - and add it to the card.
         
-        :returns:   Path to the created image containing only series count text.
+        Returns:
+            List of ImageMagick commands.
         """
 
-        # Create text only transparent image of season count text
-        command = ' '.join([
-            f'convert -size "{width}x{height}"',
-            f'-alpha on',
+        return [
+            # Create text only transparent image of season count text
+            f'\( -size "{width}x{height}"',
             f'-background transparent',
             f'xc:transparent',
+            f'-alpha on',
+            f'+gravity',
             *self.__series_count_text_global_effects(),
-            f'-font "{self.SEASON_COUNT_FONT.resolve()}"',
+            f'-font "{self.__SEASON_COUNT_FONT}"',
             *self.__series_count_text_black_stroke(),
             f'-annotate +0+{height-25} "{self.season_text} "',
             *self.__series_count_text_effects(),
             f'-annotate +0+{height-25} "{self.season_text} "',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             *self.__series_count_text_black_stroke(),
             f'-annotate +{width1}+{height-25-6.5} "{self.separator}"',
             *self.__series_count_text_effects(),
@@ -387,43 +371,15 @@ class WhiteTextStandardLogo(BaseCardType):
             *self.__series_count_text_black_stroke(),
             f'-annotate +{width1+width2}+{height-25} "{self.episode_text}"',
             *self.__series_count_text_effects(),
-            f'-annotate +{width1+width2}+{height-25} "{self.episode_text}"',
-            f'"PNG32:{self.__SERIES_COUNT_TEXT.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.__SERIES_COUNT_TEXT
-
-
-    def _combine_titled_image_series_count_text(self, titled_image: Path,
-                                                series_count_image: Path)->Path:
-        """
-        Combine the titled image (image+backdrop+episode title) and the series
-        count image (optional season number+optional dot+episode number) into a
-        single image. This is written into the output image for this object.
-
-        :param      titled_image:       Path to the titled image to add.
-        :param      series_count_image: Path to the series count transparent
-                                        image to add.
-
-        :returns:   Path to the created image (the output file).
-        """
-
-        command = ' '.join([
-            f'convert',
-            f'"{titled_image.resolve()}"',
+            f'-annotate +{width1+width2}+{height-25} "{self.episode_text}" \)',
+            # Reset text image settings so they don't apply to the output
+            f'+size',
+            f'+background',
+            # Add series count text to the card
             f'-gravity center',
-            f'"{series_count_image.resolve()}"',
             f'-geometry +0+690.2',
             f'-composite',
-            *self.resize_output,
-            f'"{self.output_file.resolve()}"',
-        ])
-
-        self.image_magick.run(command)
-
-        return self.output_file
+        ]
 
 
     @staticmethod
@@ -484,31 +440,26 @@ class WhiteTextStandardLogo(BaseCardType):
             log.error(f'Logo file "{self.logo.resolve()}" does not exist')
             return None
 
-        # Resize logo
-        resized_logo = self._resize_logo()
-        
-        # Create backdrop+logo image
-        backdrop_logo = self._add_logo_to_backdrop(resized_logo)
-
-        # Add either one or two lines of episode text 
-        titled_image = self._add_title_text(backdrop_logo)
-
-        # If season text is hidden, just add episode text 
+        # If season text is hidden, just add episode text
         if self.hide_season:
-            self._add_series_count_text_no_season(titled_image)
+            series_count_text = self.__series_count_text_no_season_commands()
         else:
-            # If adding season text, create intermediate images and combine them
-            series_count_image = self._create_series_count_text_image(
+            series_count_text = self.__series_count_text_commands(
                 **self._get_series_count_text_dimensions()
             )
-            self._combine_titled_image_series_count_text(
-                titled_image,
-                series_count_image
-            )
 
-        # Delete all intermediate images
-        images = [resized_logo, backdrop_logo, titled_image]
-        if not self.hide_season:
-            images.append(series_count_image)
-        
-        self.image_magick.delete_intermediate_images(*images)
\ No newline at end of file
+        command = ' '.join([
+            f'convert',
+            # Create backdrop+logo image
+            *self.__logo_commands(),
+            *self.resize_and_style,
+            # Add title text
+            *self.__title_text_commands(),
+            # Add season and/or episode text
+            *series_count_text,
+            # Create and resize output
+            *self.resize_output,
+            f'"{self.output_file.absolute()}"',
+        ])
+
+        self.image_magick.run(command)
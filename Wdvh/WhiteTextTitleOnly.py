@@ -1,4 +1,5 @@
 from pathlib import Path
+from uuid import uuid4
 
 from modules.BaseCardType import BaseCardType
 from modules.Debug import log
@@ -35,13 +36,10 @@ class WhiteTextTitleOnly(BaseCardType):
     """Source path for the gradient image overlayed over all title cards"""
     __GRADIENT_IMAGE = REF_DIRECTORY / 'GRADIENT.png'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __SOURCE_WITH_GRADIENT = BaseCardType.TEMP_DIR / 'source_gradient.png'
-
     __slots__ = (
         'source_file', 'output_file', 'title', 'font', 'font_size',
         'title_color', 'vertical_shift', 'interline_spacing', 'kerning',
-        'stroke_width'
+        'stroke_width', '__source_with_gradient',
     )
 
 
@@ -66,6 +64,12 @@ class WhiteTextTitleOnly(BaseCardType):
         # Initialize the parent class - this sets up an ImageMagickInterface
         super().__init__(blur, grayscale)
 
+        # Paths to intermediate files that are deleted after the card is created
+        temp_prefix = uuid4().hex
+        self.__source_with_gradient = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_source_gradient.miff'
+        )
+
         self.source_file = source_file
         self.output_file = card_file
 
@@ -135,12 +139,12 @@ class WhiteTextTitleOnly(BaseCardType):
             f'"{self.__GRADIENT_IMAGE.resolve()}"',
             f'-background None',
             f'-layers Flatten',
-            f'"{self.__SOURCE_WITH_GRADIENT.resolve()}"',
+            f'"{self.__source_with_gradient.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__SOURCE_WITH_GRADIENT
+        return self.__source_with_gradient
 
 
     def _add_title_text(self, gradient_image: Path) -> Path:
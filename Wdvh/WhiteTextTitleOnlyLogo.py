@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Optional
+from uuid import uuid4
 
 from modules.BaseCardType import BaseCardType
 from modules.Debug import log
@@ -41,14 +42,10 @@ class WhiteTextTitleOnlyLogo(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Sequel-Neue.otf'
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __RESIZED_LOGO = BaseCardType.TEMP_DIR / 'resized_logo.png'
-    __BACKDROP_WITH_LOGO = BaseCardType.TEMP_DIR / 'backdrop_logo.png'
-
     __slots__ = (
         'logo', 'output_file', 'title', 'font', 'font_size', 'title_color',
         'vertical_shift', 'interline_spacing', 'kerning', 'stroke_width',
-        'background',
+        'background', '__resized_logo', '__backdrop_with_logo',
     )
 
 
@@ -74,6 +71,15 @@ class WhiteTextTitleOnlyLogo(BaseCardType):
         # Initialize the parent class - this sets up an ImageMagickInterface
         super().__init__(blur, grayscale)
 
+        # Paths to intermediate files that are deleted after the card is created
+        temp_prefix = uuid4().hex
+        self.__resized_logo = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_resized_logo.miff'
+        )
+        self.__backdrop_with_logo = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_backdrop_logo.miff'
+        )
+
         # Convert logo to Path
         if isinstance(logo, str):
             self.logo = Path(logo)
@@ -149,12 +155,12 @@ class WhiteTextTitleOnlyLogo(BaseCardType):
             f'"{self.logo.resolve()}"',
             f'-resize x1030',
             f'-resize 1875x1030\>',
-            f'"{self.__RESIZED_LOGO.resolve()}"',
+            f'"{self.__resized_logo.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__RESIZED_LOGO
+        return self.__resized_logo
 
 
     def _add_logo_to_backdrop(self, resized_logo: Path) -> Path:
@@ -185,12 +191,12 @@ class WhiteTextTitleOnlyLogo(BaseCardType):
             f'-set colorspace sRGB',
             f'-gravity north',
             f'-geometry "+0+{offset}"',         # Put logo on backdrop
-            f'-composite "{self.__BACKDROP_WITH_LOGO.resolve()}"',
+            f'-composite "{self.__backdrop_with_logo.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__BACKDROP_WITH_LOGO
+        return self.__backdrop_with_logo
 
 
     def _add_title_text(self, backdrop_logo: Path) -> Path:
@@ -1,5 +1,6 @@
 from pathlib import Path
 from re import match
+from uuid import uuid4
 
 from num2words import num2words
 
@@ -39,13 +40,10 @@ class BarebonesTitleCard(BaseCardType):
     """How to name archive directories for this type of card"""
     ARCHIVE_NAME = 'Barebones Style'
 
-    """Paths to intermediate files that are deleted after the card is created"""
-    __RESIZED_SOURCE = BaseCardType.TEMP_DIR / 'resized_source.png'
-
     __slots__ = (
         'source_file', 'output_file', 'title', 'hide_episode_text', 
         'episode_text', 'font', 'font_size', 'title_color',
-        'episode_text_color', 'stroke_width'
+        'episode_text_color', 'stroke_width', '__resized_source',
     )
 
     
@@ -70,6 +68,12 @@ class BarebonesTitleCard(BaseCardType):
         # Initialize the parent class - this sets up an ImageMagickInterface
         super().__init__(blur, grayscale)
 
+        # Paths to intermediate files that are deleted after the card is created
+        temp_prefix = uuid4().hex
+        self.__resized_source = (
+            BaseCardType.TEMP_DIR / f'{temp_prefix}_resized_source.miff'
+        )
+
         # Store source and output file
         self.source_file = source_file
         self.output_file = card_file
@@ -110,12 +114,12 @@ class BarebonesTitleCard(BaseCardType):
         command = ' '.join([
             f'convert "{source.resolve()}"',
             *self.resize_and_style,
-            f'"{self.__RESIZED_SOURCE.resolve()}"',
+            f'"{self.__resized_source.resolve()}"',
         ])
 
         self.image_magick.run(command)
 
-        return self.__RESIZED_SOURCE
+        return self.__resized_source
 
     def __add_title_text(self) -> list[str]:
         """
@@ -40,14 +40,24 @@ class RetroTitleCard(BaseCardType):
     EPISODE_TEXT_FORMAT = "S{season_number:02}E{episode_number:02}"
     
     """Source path for the gradient image overlayed over all title cards"""
-    __GRADIENT_IMAGE_PLAY = RemoteFile('Yozora', 'ref/retro/gradient_play.png')
-    __GRADIENT_IMAGE_REWIND = RemoteFile('Yozora', 'ref/retro/gradient_rewind.png')
+    __GRADIENT_IMAGE_PLAY = str(
+        RemoteFile('Yozora', 'ref/retro/gradient_play.png')
+    )
+    __GRADIENT_IMAGE_REWIND = str(
+        RemoteFile('Yozora', 'ref/retro/gradient_rewind.png')
+    )
+    __GRADIENT_IMAGES = {
+        'play': __GRADIENT_IMAGE_PLAY, 'rewind': __GRADIENT_IMAGE_REWIND,
+    }
 
     """Default fonts and color for series count text"""
     SEASON_COUNT_FONT = RemoteFile('Yozora', 'ref/retro/retro.ttf')
     EPISODE_COUNT_FONT = RemoteFile('Yozora', 'ref/retro/retro.ttf')
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
+    """Episode count font path as used in the ImageMagick commands"""
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT)
+
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'episode_text', 'font_file',
         'font_size', 'font_color', 'font_vertical_shift',
@@ -93,10 +103,14 @@ class RetroTitleCard(BaseCardType):
         self.font_stroke_width = font_stroke_width
         self.font_vertical_shift = font_vertical_shift
         
-        # Store extras
+        # Store extras - unset or invalid overrides fall back on watch status
         self.watched = watched
         self.override_bw = override_bw.lower()
+        if self.override_bw not in ('bw', 'color'):
+            self.override_bw = 'bw' if watched else 'color'
         self.override_style = override_style.lower()
+        if self.override_style not in self.__GRADIENT_IMAGES:
+            self.override_style = 'rewind' if watched else 'play'
 
 
     @property
@@ -108,30 +122,13 @@ class RetroTitleCard(BaseCardType):
             Path to the created image.
         """
         
-        # Select gradient overlay based on override/watch status
-        if self.override_style == 'rewind':
-            gradient_image = self.__GRADIENT_IMAGE_REWIND
-        elif self.override_style == 'play':
-            gradient_image = self.__GRADIENT_IMAGE_PLAY
-        elif self.watched:
-            gradient_image = self.__GRADIENT_IMAGE_REWIND
-        else:
-            gradient_image = self.__GRADIENT_IMAGE_PLAY
-            
-        # Determine colorspace (B+W/color) on override/watch status
-        if self.override_bw == 'bw':
-            colorspace = '-colorspace gray'
-        elif self.override_bw == 'color':
-            colorspace = ''
-        elif self.watched:
-            colorspace = '-colorspace gray'
-        else:
-            colorspace = ''
+        # Watched/B+W cards are converted to grayscale after the gradient
+        colorspace = [f'-colorspace gray'] if self.override_bw == 'bw' else []
 
         return [
-            f'"{gradient_image.resolve()}"',
+            f'"{self.__GRADIENT_IMAGES[self.override_style]}"',
             f'-composite',
-            f'{colorspace}',
+            *colorspace,
         ]
 
 
@@ -149,6 +146,7 @@ class RetroTitleCard(BaseCardType):
         kerning = -1.25 * self.font_kerning
         stroke_width = 3.0 * self.font_stroke_width
         vertical_shift = 170 + self.font_vertical_shift
+        annotate = f'-annotate +229+{vertical_shift} "{self.title_text}"'
 
         return [
             f'-font "{self.font_file}"',
@@ -160,9 +158,9 @@ class RetroTitleCard(BaseCardType):
             f'-fill black',
             f'-stroke black',
             f'-strokewidth {stroke_width}',
-            f'-annotate +229+{vertical_shift} "{self.title_text}"',
+            annotate,
             f'-fill "{self.font_color}"',
-            f'-annotate +229+{vertical_shift} "{self.title_text}"',
+            annotate,
         ]
 
 
@@ -175,20 +173,22 @@ class RetroTitleCard(BaseCardType):
             List of ImageMagick commands
         """
 
+        annotate = f'-annotate +200+229 "{self.episode_text}"'
+
         return [
             f'-kerning 5.42',
             f'-pointsize 100',
             f'+interword-spacing',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity northeast',
             f'-fill black',
             f'-stroke black',
             f'-strokewidth 6',
-            f'-annotate +200+229 "{self.episode_text}"',
+            annotate,
             f'-fill white',
             f'-stroke black',
             f'-strokewidth 0.75',
-            f'-annotate +200+229 "{self.episode_text}"',
+            annotate,
         ]
 
 
@@ -240,13 +240,13 @@ class RetroTitleCard(BaseCardType):
         """
 
         command = ' '.join([
-            f'convert "{self.source_file.resolve()}"',
+            f'convert "{self.source_file.absolute()}"',
             *self.resize_and_style,
             *self.add_gradient_commands,
             *self.title_text_commands,
             *self.index_text_commands,
             *self.resize_output,
-            f'"{self.output_file.resolve()}"',
+            f'"{self.output_file.absolute()}"',
         ])
 
         self.image_magick.run(command)
\ No newline at end of file
@@ -36,13 +36,17 @@ class SlimTitleCard(BaseCardType):
     ARCHIVE_NAME = 'Slim Style'
 
     """Source path for the gradient image overlayed over all title cards"""
-    __GRADIENT_IMAGE = RemoteFile('Yozora', 'ref/slim/GRADIENT.png')
+    __GRADIENT_IMAGE = str(RemoteFile('Yozora', 'ref/slim/GRADIENT.png'))
 
     """Default fonts and color for series count text"""
     SEASON_COUNT_FONT = RemoteFile('Yozora', 'ref/slim/Comfortaa-SemiBold.ttf')
     EPISODE_COUNT_FONT = RemoteFile('Yozora', 'ref/slim/Comfortaa-Regular.ttf')
     SERIES_COUNT_TEXT_COLOR = '#a5a5a5'
 
+    """Series count font paths as used in the ImageMagick commands"""
+    __SEASON_COUNT_FONT = str(SEASON_COUNT_FONT)
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT)
+
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'season_text',
         'episode_text', 'hide_season_text', 'font_color', 'font_file',
@@ -209,7 +213,7 @@ class SlimTitleCard(BaseCardType):
         if self.hide_season_text:
             return [
                 *self.__series_count_text_global_effects(),
-                f'-font "{self.EPISODE_COUNT_FONT}"',
+                f'-font "{self.__EPISODE_COUNT_FONT}"',
                 f'-gravity center',
                 *self.__series_count_text_black_stroke(),
                 f'-annotate +0+697.2 "{self.episode_text}"',
@@ -224,10 +228,10 @@ class SlimTitleCard(BaseCardType):
             f'\(',
             *self.__series_count_text_global_effects(),
             *self.__series_count_text_black_stroke(),
-            f'-font "{self.SEASON_COUNT_FONT}"',
+            f'-font "{self.__SEASON_COUNT_FONT}"',
             f'label:"{self.season_text}"',
             f'label:"• "',
-            f'-font "{self.EPISODE_COUNT_FONT}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'label:"{self.episode_text}"',
             f'+smush 15 \)',
             f'-geometry +0+35',
@@ -236,10 +240,10 @@ class SlimTitleCard(BaseCardType):
             f'\(',
             *self.__series_count_text_global_effects(),
             *self.__series_count_text_effects(),
-            f'-font "{self.SEASON_COUNT_FONT}"',
+            f'-font "{self.__SEASON_COUNT_FONT}"',
             f'label:"{self.season_text}"',
             f'label:"• "',
-            f'-font "{self.EPISODE_COUNT_FONT}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'label:"{self.episode_text}"',
             f'+smush 18 \)',
             f'-geometry +0+35',
@@ -299,17 +303,17 @@ class SlimTitleCard(BaseCardType):
         """
 
         command = ' '.join([
-            f'convert "{self.source_file.resolve()}"',
+            f'convert "{self.source_file.absolute()}"',
             *self.resize_and_style,
             # Add gradient
-            f'"{self.__GRADIENT_IMAGE.resolve()}"',
+            f'"{self.__GRADIENT_IMAGE}"',
             f'-composite',
             # Add title and index text
             *self.title_text_command,
             *self.index_text_command,
             # Create card
             *self.resize_output,
-            f'"{self.output_file.resolve()}"',
+            f'"{self.output_file.absolute()}"',
         ])
 
         self.image_magick.run(command)
\ No newline at end of file
@@ -1,5 +1,6 @@
+from os import fspath
 from pathlib import Path
-from re import findall, compile as re_compile
+from re import compile as re_compile, MULTILINE
 from typing import Optional
 
 from modules.BaseCardType import BaseCardType, ImageMagickCommands
@@ -49,8 +50,17 @@ class TitleColorMatch(BaseCardType):
     EPISODE_COUNT_FONT = REF_DIRECTORY / 'Proxima Nova Regular.otf'
     SERIES_COUNT_TEXT_COLOR = '#CFCFCF'
 
+    """Resolved series count font paths for the index text"""
+    __SEASON_COUNT_FONT = str(SEASON_COUNT_FONT.resolve())
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT.resolve())
+
     """Regex to match colors/counts in ImageMagick histograms"""
-    __COLORDATA_REGEX = re_compile(r'[\s]*(\d*)?:\s.*\s(#\w{8}).*\n?')
+    __COLORDATA_REGEX = re_compile(
+        r'^\s*(\d+):\s[^#]*(#[0-9A-Fa-f]{6})([0-9A-Fa-f]{2})', MULTILINE
+    )
+
+    """Logo colors that have already been determined, keyed by logo file"""
+    __LOGO_COLOR_CACHE: dict[tuple[str, int, int], tuple[str, str]] = {}
 
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'season_text',
@@ -95,16 +105,20 @@ class TitleColorMatch(BaseCardType):
             try:
                 logo = logo.format(season_number=season_number,
                                    episode_number=episode_number)
-                self.logo = Path(CleanPath(logo).sanitize())
+                self.logo = Path(CleanPath(logo).sanitize()).resolve()
             except Exception as e:
                 self.valid = False
                 log.exception(f'Invalid logo file "{logo}"', e)
 
         # Ensure characters that need to be escaped are
+        self.hide_season_text = hide_season_text or len(season_text) == 0
         self.title_text = self.image_magick.escape_chars(title_text)
-        self.season_text = self.image_magick.escape_chars(season_text.upper())
+        if self.hide_season_text:
+            self.season_text = ''
+        else:
+            season_text = season_text.upper()
+            self.season_text = self.image_magick.escape_chars(season_text)
         self.episode_text = self.image_magick.escape_chars(episode_text.upper())
-        self.hide_season_text = hide_season_text or len(season_text) == 0
         
         self.font_color = font_color
         self.font_file = font_file
@@ -127,7 +141,7 @@ class TitleColorMatch(BaseCardType):
 
         return [
             # Resize logo
-            f'\( "{self.logo.resolve()}"',
+            f'\( "{self.logo}"',
             f'-trim',
             f'+repage',
             f'-resize x650',
@@ -152,22 +166,31 @@ class TitleColorMatch(BaseCardType):
             List of ImageMagick commands.
         """
 
-        # Get the title color and stroke for this logo
-        title_color, stroke_color = self._get_logo_color()
-
         font_size = 157.41 * self.font_size
         interline_spacing = -22 + self.font_interline_spacing
         kerning = -1.25 * self.font_kerning
         stroke_width = 3.0 * self.font_stroke_width
         vertical_shift = 125 + self.font_vertical_shift
 
-        return [
+        # Global text settings, the index text inherits these
+        text_settings = [
             f'-font "{self.font_file}"',
             f'-kerning {kerning}',
             f'-interword-spacing 50',
             f'-interline-spacing {interline_spacing}',
             f'-pointsize {font_size}',
             f'-gravity southwest',
+        ]
+
+        # No title text, skip color detection and annotation
+        if len(self.title_text) == 0:
+            return text_settings
+
+        # Get the title color and stroke for this logo
+        title_color, stroke_color = self._get_logo_color()
+
+        return [
+            *text_settings,
             f'-fill {stroke_color}',
             f'-stroke {stroke_color}',
             f'-strokewidth {stroke_width}',
@@ -190,55 +213,54 @@ class TitleColorMatch(BaseCardType):
         if self.font_color.lower() != 'auto':
             return self.font_color, 'black'
 
+        # Reuse the color of this logo if it has already been determined
+        logo_stat = self.logo.stat()
+        cache_key = (
+            fspath(self.logo), logo_stat.st_mtime_ns, logo_stat.st_size
+        )
+        if (logo_color := self.__LOGO_COLOR_CACHE.get(cache_key)) is not None:
+            return logo_color
+
         # Command to get histogram of the colors in logo image
         command = ' '.join([
-            f'convert "{self.logo.resolve()}"',
-            f'-scale 100x100!',
+            f'convert "{self.logo}[0]"',
+            f'-scale 50x50!',
             f'-depth 8 +dither',
             f'-colors 16',
             f'-format "%c" histogram:info:',
         ])
 
-        # Get color data
+        # Get the pixel count, color, and alpha of each color in the logo
         colordata = self.image_magick.run_get_output(command)
-        cdata = {
-            k: [num, hex_] for k, (num, hex_)
-            in enumerate(findall(self.__COLORDATA_REGEX, colordata), start=1)
-        }
-
-        translist = []
-        pixcount = []
-        for key, pair in cdata.items():
-            h = int(pair[1][-2:], 16)
-            if h < 75:
-                translist.append(key)
-            else:
-                pixcount.append(int(pair[0]))
-
-        for key in translist:
-            del cdata[key]
+        colors = [
+            (int(match[1]), match[2], int(match[3], 16))
+            for match in self.__COLORDATA_REGEX.finditer(colordata)
+        ]
 
         # Go through colors in descending order of appearance
-        pixcount.sort(reverse=True)
-        pairs = list(cdata.values())
-        for num in pixcount:
+        colors.sort(key=lambda color: color[0], reverse=True)
+        for _, hexcolor, alpha in colors:
+            # Skip (mostly) transparent colors
+            if alpha < 75:
+                continue
+
             # Get the RGB value from the hexcolor
-            hexcolor = next(x[1][:7] for x in pairs if int(x[0]) == num)
+            r, g, b = bytes.fromhex(hexcolor[1:])
 
-            color_ = hexcolor.lstrip('#')
-            lv = len(color_)
-            r, g, b = (int(color_[i:i+lv//3], 16) for i in range(0, lv, lv//3))
-            
             # Skip values that are too dark/light
             if min(r, g, b) > 240 or max(r, g, b) < 15:
                 continue
 
             # First valid color, return color and stroke based on luminance
             luminance = (r * 0.299) + (g * 0.587) + (b * 0.114)
-            return hexcolor, 'black' if luminance > 50 else 'white'
+            logo_color = hexcolor, 'black' if luminance > 50 else 'white'
+            self.__LOGO_COLOR_CACHE[cache_key] = logo_color
+            return logo_color
 
-        # No valid colors identified, return defaults
-        return self.TITLE_COLOR, 'black'
+        # No valid colors identified, return (and remember) defaults
+        logo_color = self.TITLE_COLOR, 'black'
+        self.__LOGO_COLOR_CACHE[cache_key] = logo_color
+        return logo_color
 
     
     @property
@@ -256,7 +278,7 @@ class TitleColorMatch(BaseCardType):
             return [
                 f'-kerning 5.42',
                 f'-pointsize 67.75',
-                f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+                f'-font "{self.__EPISODE_COUNT_FONT}"',
                 f'-gravity southwest',
                 f'-fill black',
                 f'-stroke black',
@@ -268,6 +290,19 @@ class TitleColorMatch(BaseCardType):
                 f'-annotate +50+50 "{self.episode_text}"',
             ]
 
+        # Season and episode text labels, added once for stroke and fill
+        series_count_text = [
+            f'\( -gravity center',
+            f'-font "{self.__SEASON_COUNT_FONT}"',
+            f'label:"{self.season_text} •"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
+            f'label:"{self.episode_text}"',
+            f'+smush 30 \)',
+            f'-gravity southwest',
+            f'-geometry +50+50',
+            f'-composite',
+        ]
+
         return [
             f'-background transparent',
             f'+interword-spacing',
@@ -276,27 +311,11 @@ class TitleColorMatch(BaseCardType):
             f'-fill black',
             f'-stroke black',
             f'-strokewidth 6',
-            f'\( -gravity center',
-            f'-font "{self.SEASON_COUNT_FONT.resolve()}"',
-            f'label:"{self.season_text} •"',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
-            f'label:"{self.episode_text}"',
-            f'+smush 30 \)',
-            f'-gravity southwest',
-            f'-geometry +50+50',
-            f'-composite',
+            *series_count_text,
             f'-fill "{self.SERIES_COUNT_TEXT_COLOR}"',
             f'-stroke "{self.SERIES_COUNT_TEXT_COLOR}"',
             f'-strokewidth 0.75',
-            f'\( -gravity center',
-            f'-font "{self.SEASON_COUNT_FONT.resolve()}"',
-            f'label:"{self.season_text} •"',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
-            f'label:"{self.episode_text}"',
-            f'+smush 30 \)',
-            f'-gravity southwest',
-            f'-geometry +50+50',
-            f'-composite',
+            *series_count_text,
         ]
 
 
@@ -355,13 +374,13 @@ class TitleColorMatch(BaseCardType):
             log.error(f'Logo file not specified')
             return None
         elif not self.logo.exists():
-            log.error(f'Logo file "{self.logo.resolve()}" does not exist')
+            log.error(f'Logo file "{self.logo}" does not exist')
             return None
 
         command = ' '.join([
             f'convert',
             # Resize source image
-            f'"{self.source_file.resolve()}"',
+            f'"{self.source_file.absolute()}"',
             *self.resize_and_style,
             # Overlay gradient
             f'"{self.__GRADIENT_IMAGE}"',
@@ -374,7 +393,7 @@ class TitleColorMatch(BaseCardType):
             *self.index_text_command,
             # Create and resize output
             *self.resize_output,
-            f'"{self.output_file.resolve()}"',
+            f'"{self.output_file.absolute()}"',
         ])
 
         self.image_magick.run(command)
\ No newline at end of file
@@ -39,13 +39,16 @@ class WhiteTextBroadcast(BaseCardType):
     EPISODE_TEXT_FORMAT = "S{season_number:02}E{episode_number:02}"
     
     """Source path for the gradient image overlayed over all title cards"""
-    __GRADIENT_IMAGE = RemoteFile('lyonza', 'GRADIENTABS.png')
+    __GRADIENT_IMAGE = str(RemoteFile('lyonza', 'GRADIENTABS.png'))
 
     """Default fonts and color for series count text"""
     SEASON_COUNT_FONT = RemoteFile('lyonza', 'TerminalDosis-Bold.ttf')
     EPISODE_COUNT_FONT = RemoteFile('lyonza', 'TerminalDosis-Bold.ttf')
     SERIES_COUNT_TEXT_COLOR = '#FFFFFF'
 
+    """Episode count font path used in the series count text command"""
+    __EPISODE_COUNT_FONT = str(EPISODE_COUNT_FONT)
+
     __slots__ = (
         'source_file', 'output_file', 'title_text', 'episode_text',
         'hide_season_text', 'font_file', 'font_size', 'font_color',
@@ -136,7 +139,7 @@ class WhiteTextBroadcast(BaseCardType):
             f'+interword-spacing',
             f'-kerning 5.42',
             f'-pointsize 120',
-            f'-font "{self.EPISODE_COUNT_FONT.resolve()}"',
+            f'-font "{self.__EPISODE_COUNT_FONT}"',
             f'-gravity west',
             # Add black stroke
             f'-fill black',
@@ -202,12 +205,12 @@ class WhiteTextBroadcast(BaseCardType):
             gradient_command = []
         else:
             gradient_command = [
-                f'"{self.__GRADIENT_IMAGE.resolve()}"',
+                f'"{self.__GRADIENT_IMAGE}"',
                 f'-composite',
             ]
 
         command = ' '.join([
-            f'convert "{self.source_file.resolve()}"',
+            f'convert "{self.source_file.absolute()}"',
             # Overlay gradient
             *self.resize_and_style,
             *gradient_command,
@@ -215,7 +218,7 @@ class WhiteTextBroadcast(BaseCardType):
             *self.index_text_command,
             # Resize and write output
             *self.resize_output,
-            f'"{self.output_file.resolve()}"',
+            f'"{self.output_file.absolute()}"',
         ])
         
         self.image_magick.run(command)
\ No newline at end of file